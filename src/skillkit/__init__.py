@@ -1,11 +1,39 @@
-"""Shared utilities for Agent Skills scripts."""
+"""Shared utilities for Agent Skills scripts.
 
-from skillkit.cli import ScriptOptions, parse_script_args
-from skillkit.detect import detect_build_system
-from skillkit.fs import atomic_write
-from skillkit.git import current_branch, git_root, is_dirty
-from skillkit.proc import ProcResult, run
-from skillkit.report import Action, Diagnostic, ExitCode, Report, emit_report
+The re-exports below are resolved on first access so that importing one
+submodule (for example ``skillkit.naming``) does not load the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skillkit.cli import ScriptOptions, parse_script_args
+    from skillkit.detect import detect_build_system
+    from skillkit.fs import atomic_write, iter_skill_dirs
+    from skillkit.git import current_branch, git_root, is_dirty
+    from skillkit.proc import ProcResult, run
+    from skillkit.report import Action, Diagnostic, ExitCode, Report, emit_report
+
+_EXPORTS = {
+    "Action": "report",
+    "Diagnostic": "report",
+    "ExitCode": "report",
+    "ProcResult": "proc",
+    "Report": "report",
+    "ScriptOptions": "cli",
+    "atomic_write": "fs",
+    "current_branch": "git",
+    "detect_build_system": "detect",
+    "emit_report": "report",
+    "git_root": "git",
+    "is_dirty": "git",
+    "iter_skill_dirs": "fs",
+    "parse_script_args": "cli",
+    "run": "proc",
+}
 
 __all__ = [
     "Action",
@@ -20,6 +48,23 @@ __all__ = [
     "emit_report",
     "git_root",
     "is_dirty",
+    "iter_skill_dirs",
     "parse_script_args",
     "run",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a re-exported name from its submodule on first use."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily re-exported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,156 @@
+"""SKILL.md front matter helpers shared by the repository tools."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Regular expressions are kept as pattern strings and compiled through the
+# re module's cache on first use, so importing this module stays cheap for
+# tools that never parse front matter (e.g. ``--help``).
+_LINE_PATTERN = r"^( *)([A-Za-z_][\w-]*):(?: +(.*))?$"
+# First characters that make a plain scalar special (YAML indicators) or
+# let a resolver turn it into a non-string (numbers, ~, .inf, << ...).
+_NON_PLAIN_START = frozenset("-?:,[]{}#&*!|>'\"%@`~+.<=0123456789")
+_IMPLICIT_WORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+# Characters outside YAML's printable set (C0 controls other than tab and
+# line ends, DEL, C1 controls, surrogates, U+FFFE/U+FFFF), plus the Unicode
+# line separators, which YAML and str.splitlines() do not treat alike.
+_NON_PRINTABLE = (
+    "[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]"
+)
+# YAML does not allow tabs in indentation, even on otherwise blank lines.
+_LEADING_TAB = "(?:\\A|[\r\n]) *\t"
+# A mapping indicator or comment start inside an otherwise plain scalar.
+_PLAIN_INDICATOR = "[ \t]#|:[ \t]"
+# Line boundaries other than "\n" that str.splitlines() also honours.
+_OTHER_LINE_BREAK = "[\r\v\f\x1c-\x1e\x85\u2028\u2029]"
+_MISSING_START = "missing YAML frontmatter start line '---'"
+_MISSING_END = "missing YAML frontmatter end line '---'"
+# Past this many bytes without a closing marker, read() stops probing.
+_PROBE_LIMIT = 64 * 1024
+
+
+def split(text: str) -> tuple[str | None, str | None]:
+    """Return the front matter block of a SKILL.md document, or an error."""
+    if text.startswith("---\n"):
+        end = text.find("\n---", 3)
+        if end >= 0:
+            block = text[4:end]
+            line_end = text.find("\n", end + 4)
+            rest = text[end + 4 : line_end if line_end >= 0 else len(text)]
+            if (
+                not rest.strip()
+                and "---" not in block
+                and re.search(_OTHER_LINE_BREAK, block) is None
+            ):
+                return block, None
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return None, _MISSING_START
+    for end, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            return "\n".join(lines[1:end]), None
+    return None, _MISSING_END
+
+
+def read(path: Path, chunk_size: int = 4096) -> str:
+    """Read a SKILL.md file only as far as its front matter.
+
+    Whole lines are read until the closing ``---`` line has been seen, so
+    :func:`split` gives the same result as on the full document. Files with
+    no complete block in their first 64 KiB are read to the end in one go.
+    """
+    buffer = b""
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            buffer += chunk
+            if len(buffer) > _PROBE_LIMIT:
+                return (buffer + handle.read()).decode("utf-8")
+            end = buffer.rfind(b"\n") + 1
+            if end:
+                text = buffer[:end].decode("utf-8")
+                if split(text)[1] != _MISSING_END:
+                    return text
+    return buffer.decode("utf-8")
+
+
+def _simple_scalar(value: str) -> str | None:
+    """Return a scalar's string value if YAML would read it verbatim."""
+    first = value[0]
+    if first.isspace():
+        return None
+    if first in {'"', "'"}:
+        inner = value[1:-1]
+        closed = len(value) > 1 and value.endswith(first)
+        return inner if closed and first not in inner and "\\" not in inner else None
+    if (
+        first in _NON_PLAIN_START
+        or value.lower() in _IMPLICIT_WORDS
+        or re.search(_PLAIN_INDICATOR, value) is not None
+        or value.endswith(":")
+    ):
+        return None
+    return value
+
+
+def _entry_lines(text: str) -> Iterator[re.Match[str] | None]:
+    """Yield a line-pattern match per significant line, None if unsupported."""
+    if re.search(_NON_PRINTABLE, text) or re.search(_LEADING_TAB, text):
+        yield None
+        return
+    for raw in text.splitlines():
+        line = raw.rstrip(" \t")
+        if line and not line.lstrip(" ").startswith("#"):
+            yield re.match(_LINE_PATTERN, line)
+
+
+def parse_simple(text: str) -> dict[str, str | dict[str, str] | None] | None:
+    """Parse flat ``key: value`` front matter without PyYAML.
+
+    One level of nested mappings (``metadata:``) is supported. Returns None
+    whenever the block uses anything else, so callers can fall back to YAML.
+    """
+    data: dict[str, str | dict[str, str] | None] = {}
+    block_key: str | None = None
+    block_indent = 0
+    for match in _entry_lines(text):
+        if match is None or match[2].lower() in _IMPLICIT_WORDS:
+            return None
+        indent, key, value = len(match[1]), match[2], match[3]
+        if not value:
+            if indent:
+                return None
+            block_key, block_indent = key, 0
+            data[key] = None
+            continue
+        scalar = _simple_scalar(value)
+        if scalar is None:
+            return None
+        if not indent:
+            block_key = None
+            data[key] = scalar
+            continue
+        if block_key is None or block_indent not in {0, indent}:
+            return None
+        block_indent = indent
+        block = data[block_key]
+        if not isinstance(block, dict):
+            block = data[block_key] = {}
+        block[key] = scalar
+    return data or None
+
+
+def parse(text: str) -> object:
+    """Parse front matter, falling back to PyYAML for non-flat blocks."""
+    data = parse_simple(text)
+    if data is not None:
+        return data
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)  # noqa: S506
@@ -2,14 +2,46 @@
 
 from __future__ import annotations
 
-import tempfile
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-def atomic_write(path: Path, content: str) -> None:
-    """Write content to a file atomically."""
+_PRUNED = frozenset({"__pycache__", ".git", "node_modules"})
+
+
+def atomic_write(path: Path, content: str | bytes) -> None:
+    """Write content to a file atomically (text is encoded as UTF-8)."""
+    # Deferred: tempfile pulls in shutil and random, which the directory
+    # walker does not need.
+    import tempfile
+
+    data = content.encode("utf-8") if isinstance(content, str) else content
     path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile("w", delete=False, dir=path.parent) as handle:
-        handle.write(content)
+    with tempfile.NamedTemporaryFile("wb", delete=False, dir=path.parent) as handle:
+        handle.write(data)
         temp_path = Path(handle.name)
     temp_path.replace(path)
+
+
+def iter_skill_dirs(root: Path) -> Iterator[Path]:
+    """Yield directories under root that contain a SKILL.md file.
+
+    A skill directory is not searched any further, symlinked directories are
+    not followed, and caches/VCS/vendor directories are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            subdirs: list[str] = []
+            for entry in entries:
+                if entry.name == "SKILL.md" and not entry.is_dir(follow_symlinks=False):
+                    yield Path(current)
+                    break
+                if entry.is_dir(follow_symlinks=False) and entry.name not in _PRUNED:
+                    subdirs.append(entry.path)
+            else:
+                stack.extend(subdirs)
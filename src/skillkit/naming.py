@@ -0,0 +1,29 @@
+"""Agent Skills naming rules shared by the repository tools."""
+
+from __future__ import annotations
+
+import re
+from functools import cache
+
+AGENT_SKILLS_NAME_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+MAX_NAME_LENGTH = 64
+MAX_DESCRIPTION_LENGTH = 500
+
+
+def skill_name_error(name: str) -> str | None:
+    """Return why a skill name breaks the Agent Skills standard, if it does."""
+    if not (1 <= len(name) <= MAX_NAME_LENGTH):
+        return "skill name must be 1-64 characters"
+    # Every hyphen must be followed by [a-z0-9], so '--' cannot match either.
+    if not AGENT_SKILLS_NAME_RE.fullmatch(name):
+        return (
+            "skill name must match ^[a-z0-9]+(?:-[a-z0-9]+)*$ "
+            "(lowercase/digits/hyphens)"
+        )
+    return None
+
+
+@cache
+def test_filename_for_skill(name: str) -> str:
+    """Return the canonical test filename for a skill."""
+    return f"test_{name.replace('-', '_')}.py"
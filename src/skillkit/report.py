@@ -18,7 +18,7 @@ class ExitCode(IntEnum):
     ERROR = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """Action executed by a skill."""
 
@@ -29,7 +29,7 @@ class Action:
     stderr: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Diagnostic:
     """Diagnostic message for a skill run."""
 
@@ -52,7 +52,7 @@ def _empty_artifacts() -> list[str]:
     return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Report:
     """Normalized report for skill scripts."""
 
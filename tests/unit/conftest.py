@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session")
+def sample_skills_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a read-only skills tree once for tests that only inspect it."""
+    skills_root = tmp_path_factory.mktemp("skills")
+    for tier, name, description in (
+        (".curated", "git-status", "Git status helper"),
+        (".experimental", "build-go", "Build Go projects"),
+    ):
+        skill_dir = skills_root / tier / name
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "references" / "README.md").write_text(
+            "# References\n",
+            encoding="utf-8",
+        )
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {description}\n---\n",
+            encoding="utf-8",
+        )
+    return skills_root
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import yaml
+
+from skillkit.frontmatter import parse_simple, read, split
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "name: build-go\ndescription: Build Go projects\n",
+        'name: build-go\ndescription: "Build: Go projects"\n',
+        "# comment\nname: build-go\nmetadata:\n  owner: devtools\n  kind: 'build'\n",
+    ],
+)
+def test_parse_simple_matches_yaml(text: str) -> None:
+    """The fast path should agree with PyYAML for flat front matter."""
+    assert parse_simple(text) == yaml.safe_load(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "name: 123\n",
+        "name: yes\n",
+        "name: a # comment\n",
+        'name: "a\\"b"\n',
+        "name: a\n  continued\n",
+        "metadata:\n  tags: [build, go]\n",
+        "description: Build Go\x07 projects\n",
+        "description: Build Go\x7f projects\n",
+        "description: Build Go\x85 projects\n",
+        "name: \tbuild-go\n",
+        "name: build-go\t# comment\n",
+        "name: build-go\n\t\n",
+    ],
+)
+def test_parse_simple_defers_to_yaml(text: str) -> None:
+    """Anything beyond plain string scalars should fall back to PyYAML."""
+    assert parse_simple(text) is None
+
+
+def test_split_returns_block_between_markers() -> None:
+    """Only the text between the first two marker lines is returned."""
+    assert split("---\nname: a\n---\nbody\n---\n") == ("name: a", None)
+    assert split("name: a\n")[1] == "missing YAML frontmatter start line '---'"
+    assert split("---\nname: a\n")[1] == "missing YAML frontmatter end line '---'"
+    assert split("---\r\nname: a\r\n---\r\n") == ("name: a", None)
+    assert split("---\n  --- \nname: a\n---\n") == ("", None)
+
+
+def test_read_stops_after_front_matter(tmp_path: Path) -> None:
+    """The body after the closing marker should not be read or decoded."""
+    skill_md = tmp_path / "SKILL.md"
+    head = "---\nname: a\n---\n"
+    skill_md.write_bytes(head.encode() + b"# Body\n\xff" * 10_000)
+    text = read(skill_md, chunk_size=8)
+    assert text.startswith(head)
+    assert split(text) == ("name: a", None)
+
+
+def test_read_returns_whole_file_without_closing_marker(tmp_path: Path) -> None:
+    """An unterminated block should be read in full, past the probe limit."""
+    skill_md = tmp_path / "SKILL.md"
+    text = "---\nname: a\n" + "body line\n" * 20_000
+    skill_md.write_text(text, encoding="utf-8")
+    assert read(skill_md) == text
+    assert split(read(skill_md))[1] == "missing YAML frontmatter end line '---'"
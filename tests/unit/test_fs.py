@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from skillkit.fs import atomic_write, iter_skill_dirs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_atomic_write_encodes_text_as_utf8(tmp_path: Path) -> None:
+    """Text content should be written as UTF-8 regardless of locale."""
+    target = tmp_path / "nested" / "index.json"
+    atomic_write(target, "スキル\n")
+    assert target.read_bytes() == "スキル\n".encode()
+
+
+def test_atomic_write_accepts_bytes(tmp_path: Path) -> None:
+    """Pre-encoded payloads should be written unchanged."""
+    target = tmp_path / "index.json"
+    atomic_write(target, b"[]\n")
+    assert target.read_bytes() == b"[]\n"
+
+
+def test_iter_skill_dirs_prunes_caches_and_skill_dirs(tmp_path: Path) -> None:
+    """Only top-level skill directories should be yielded, including hidden tiers."""
+    for rel in (
+        ".curated/git-status",
+        ".curated/git-status/references",
+        ".experimental/__pycache__",
+    ):
+        (tmp_path / rel).mkdir(parents=True)
+        (tmp_path / rel / "SKILL.md").write_text("---\n---\n", encoding="utf-8")
+    assert list(iter_skill_dirs(tmp_path)) == [tmp_path / ".curated" / "git-status"]
@@ -7,11 +7,12 @@ from tools.generate_skill_tests import main
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pytest
 
-def test_generate_skill_tests_creates_file(tmp_path: Path) -> None:
-    """Script-backed skills should get a pytest skeleton."""
-    skills_root = tmp_path / "skills"
-    skill_dir = skills_root / ".experimental" / "build-go"
+
+def make_script_skill(skills_root: Path, tier: str = ".experimental") -> None:
+    """Create a minimal script-backed skill under skills_root."""
+    skill_dir = skills_root / tier / "build-go"
     (skill_dir / "scripts").mkdir(parents=True)
     (skill_dir / "scripts" / "run.py").write_text(
         "#!/usr/bin/env python3\n",
@@ -22,8 +23,44 @@ def test_generate_skill_tests_creates_file(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
+
+def test_generate_skill_tests_creates_file(tmp_path: Path) -> None:
+    """Script-backed skills should get a pytest skeleton."""
+    skills_root = tmp_path / "skills"
+    make_script_skill(skills_root)
+
     tests_dir = tmp_path / "tests" / "skills"
     assert main(["--skills-root", str(skills_root), "--tests-dir", str(tests_dir)]) == 0
 
     test_file = tests_dir / "test_build_go.py"
     assert test_file.exists()
+
+
+def test_generate_skill_tests_overwrite_skips_unchanged(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """--overwrite should not rewrite a test that is already up to date."""
+    skills_root = tmp_path / "skills"
+    make_script_skill(skills_root)
+    tests_dir = tmp_path / "tests" / "skills"
+    args = ["--skills-root", str(skills_root), "--tests-dir", str(tests_dir)]
+    assert main(args) == 0
+    capsys.readouterr()
+
+    assert main([*args, "--overwrite"]) == 0
+    assert "tests generated: 0, skipped: 1" in capsys.readouterr().out
+
+
+def test_generate_skill_tests_shared_name_written_once(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Same-named skills in two tiers should produce one test file."""
+    skills_root = tmp_path / "skills"
+    make_script_skill(skills_root, ".curated")
+    make_script_skill(skills_root, ".experimental")
+    tests_dir = tmp_path / "tests" / "skills"
+
+    assert main(["--skills-root", str(skills_root), "--tests-dir", str(tests_dir)]) == 0
+    assert "tests generated: 1, skipped: 1" in capsys.readouterr().out
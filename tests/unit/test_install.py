@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tools.install import install_skill, main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_source(tmp_path: Path) -> Path:
+    """Create a curated source tree with two skills."""
+    source = tmp_path / "curated"
+    for name in ("build-go", "git-status"):
+        skill_dir = source / name / "references"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "README.md").write_text("# References\n", encoding="utf-8")
+    return source
+
+
+def test_install_skill_replaces_existing_copy(tmp_path: Path) -> None:
+    """Reinstalling in copy mode should replace the previous tree."""
+    source = make_source(tmp_path) / "build-go"
+    destination = tmp_path / "out" / "build-go"
+    destination.parent.mkdir()
+    install_skill(source, destination, "copy")
+    (destination / "stale.txt").write_text("old\n", encoding="utf-8")
+    install_skill(source, destination, "copy")
+    assert not (destination / "stale.txt").exists()
+    assert (destination / "references" / "README.md").is_file()
+
+
+@pytest.mark.parametrize("mode", ["copy", "hardlink", "symlink"])
+@pytest.mark.parametrize("aliased", [False, True])
+def test_main_installs_once_into_aliased_targets(
+    tmp_path: Path,
+    mode: str,
+    *,
+    aliased: bool,
+) -> None:
+    """Targets that resolve to one directory should be installed only once."""
+    source = make_source(tmp_path)
+    real = tmp_path / "real"
+    real.mkdir()
+    other = real
+    if aliased:
+        other = tmp_path / "alias"
+        other.symlink_to(real, target_is_directory=True)
+    args = ["--mode", mode, "--source", str(source)]
+    args += ["--codex-dir", str(real), "--claude-dir", str(other)]
+    # The second run replaces existing installs, which is where racing
+    # writers to one destination collide.
+    assert main(args) == 0
+    assert main(args) == 0
+    for name in ("build-go", "git-status"):
+        installed = real / name / "references" / "README.md"
+        assert installed.is_file()
+        if mode == "hardlink":
+            assert not (real / name).is_symlink()
+            source_file = source / name / "references" / "README.md"
+            assert installed.stat().st_ino == source_file.stat().st_ino
+            assert installed.stat().st_nlink > 1
+
+
+def test_install_skill_keeps_matching_symlink(tmp_path: Path) -> None:
+    """A symlink that already points at the source should be left in place."""
+    source = make_source(tmp_path) / "build-go"
+    destination = tmp_path / "out" / "build-go"
+    destination.parent.mkdir()
+    install_skill(source, destination, "symlink")
+    before = destination.lstat()
+    install_skill(source, destination, "symlink")
+    after = destination.lstat()
+    assert destination.readlink() == source
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
@@ -17,7 +17,10 @@ def test_validate_name_accepts_valid() -> None:
     validate_skill_name("build-go")
 
 
-@pytest.mark.parametrize("name", ["Build-Go", "build_go", "-bad", "bad-", "bad--name"])
+@pytest.mark.parametrize(
+    "name",
+    ["Build-Go", "build_go", "-bad", "bad-", "bad--name", "build-go\n"],
+)
 def test_validate_name_rejects_invalid(name: str) -> None:
     """Invalid names should raise ValueError."""
     with pytest.raises(ValueError, match="skill name must"):
@@ -1,31 +1,33 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+import os
+import subprocess
+from typing import TYPE_CHECKING, Any
 
-from tools.validate_skills import main
+import pytest
+
+from tools import validate_skills
+from tools.validate_skills import (
+    load_frontmatter_cache,
+    main,
+    parse_frontmatter_block,
+    save_frontmatter_cache,
+    validate_exec_mode,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    import pytest
+    from tools.validate_skills import FrontmatterCache
 
 
-def test_validate_skills_ok(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+def test_validate_skills_ok(
+    sample_skills_root: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
     """Matching name/description should produce an OK summary."""
-    skills_root = tmp_path / "skills"
-    skill_dir = skills_root / ".experimental" / "build-go"
-    (skill_dir / "references").mkdir(parents=True)
-    (skill_dir / "references" / "README.md").write_text(
-        "# References\n",
-        encoding="utf-8",
-    )
-    (skill_dir / "SKILL.md").write_text(
-        "---\nname: build-go\ndescription: Build Go projects\n---\n",
-        encoding="utf-8",
-    )
-
-    assert main(["--skills-root", str(skills_root), "--json"]) == 0
+    assert main(["--skills-root", str(sample_skills_root), "--json"]) == 0
     output = capsys.readouterr().out
     payload = json.loads(output)
     assert payload["summary"]["errors"] == 0
@@ -49,3 +51,111 @@ def test_validate_skills_name_mismatch(
     output = capsys.readouterr().out
     payload = json.loads(output)
     assert payload["summary"]["errors"] >= 1
+
+
+def test_parse_frontmatter_block_rereads_changed_file(tmp_path: Path) -> None:
+    """Cached parses should be invalidated when SKILL.md changes."""
+    skill_md = tmp_path / "SKILL.md"
+    cache: FrontmatterCache = {}
+    skill_md.write_text("---\nname: a\ndescription: b\n---\n", encoding="utf-8")
+    assert parse_frontmatter_block(skill_md, cache)[:2] == ("a", "b")
+    skill_md.write_text("---\nname: abc\ndescription: b\n---\n", encoding="utf-8")
+    assert parse_frontmatter_block(skill_md, cache)[:2] == ("abc", "b")
+
+
+def test_validate_skills_duplicate_name(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The same name in two tiers should be reported once, on the later skill."""
+    skills_root = tmp_path / "skills"
+    for tier in (".curated", ".experimental"):
+        skill_dir = skills_root / tier / "build-go"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: build-go\ndescription: Build Go projects\n---\n",
+            encoding="utf-8",
+        )
+
+    assert main(["--skills-root", str(skills_root), "--json"]) == 1
+    reports = json.loads(capsys.readouterr().out)["reports"]
+    duplicates = [
+        (report["tier"], issue["message"])
+        for report in reports
+        for issue in report["issues"]
+        if issue["message"].startswith("duplicate skill name")
+    ]
+    assert len(duplicates) == 1
+    assert duplicates[0][0] == ".experimental"
+
+
+def write_cached_skill(tmp_path: Path) -> Path:
+    """Cache a parse of SKILL.md, then change its text but not mtime/size."""
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("---\nname: a\ndescription: b\n---\n", encoding="utf-8")
+    stat = skill_md.stat()
+    cache: FrontmatterCache = {}
+    parse_frontmatter_block(skill_md, cache)
+    save_frontmatter_cache(tmp_path / "cache" / "frontmatter.json", cache, [skill_md])
+    skill_md.write_text("---\nname: z\ndescription: b\n---\n", encoding="utf-8")
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    return skill_md
+
+
+def test_frontmatter_cache_round_trip(tmp_path: Path) -> None:
+    """Persisted parses should be reused while mtime and size still match."""
+    skill_md = write_cached_skill(tmp_path)
+    cache = load_frontmatter_cache(tmp_path / "cache" / "frontmatter.json")
+    assert parse_frontmatter_block(skill_md, cache)[:2] == ("a", "b")
+    assert parse_frontmatter_block(skill_md)[:2] == ("z", "b")
+
+
+def test_frontmatter_cache_ignores_other_stamp(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A cache written by another parser setup should not be reused."""
+    write_cached_skill(tmp_path)
+    monkeypatch.setattr(validate_skills, "CACHE_FORMAT_VERSION", -1)
+    assert load_frontmatter_cache(tmp_path / "cache" / "frontmatter.json") == {}
+
+
+def test_exec_probe_is_reaped_when_second_spawn_fails(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A started probe should be waited on and closed if the next one fails."""
+    entry = tmp_path / "run.py"
+    entry.write_text("print('usage')\n", encoding="utf-8")
+    real_popen = subprocess.Popen
+    started: list[subprocess.Popen[bytes]] = []
+
+    def popen(*args: Any, **kwargs: Any) -> subprocess.Popen[bytes]:
+        if started:
+            msg = "spawn failed"
+            raise OSError(msg)
+        proc = real_popen(*args, **kwargs)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    with pytest.raises(OSError, match="spawn failed"):
+        validate_exec_mode([], entry, tmp_path)
+    assert started[0].returncode is not None
+    assert started[0].stdout is not None
+    assert started[0].stdout.closed
+
+
+def test_frontmatter_cache_skips_malformed_entries(tmp_path: Path) -> None:
+    """Entries with unexpected value types should be skipped."""
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("---\nname: a\ndescription: b\n---\n", encoding="utf-8")
+    stat = skill_md.stat()
+    cache_file = tmp_path / "frontmatter.json"
+    entry = [stat.st_mtime_ns, stat.st_size, 123, "b", None]
+    payload = {
+        "stamp": validate_skills.frontmatter_cache_stamp(),
+        "entries": {os.fspath(skill_md): entry},
+    }
+    cache_file.write_text(json.dumps(payload), encoding="utf-8")
+    assert load_frontmatter_cache(cache_file) == {}
@@ -5,12 +5,17 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
-import yaml
-
-FRONT_MATTER_SPLIT = 3
+try:
+    from skillkit import frontmatter
+    from skillkit.fs import atomic_write, iter_skill_dirs
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+    from skillkit import frontmatter
+    from skillkit.fs import atomic_write, iter_skill_dirs
 
 
 @dataclass(frozen=True)
@@ -25,12 +30,11 @@ class SkillEntry:
 
 def load_meta(skill_dir: Path) -> SkillEntry:
     """Load metadata for a skill."""
-    content = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
-    parts = content.split("---", 2)
-    if len(parts) < FRONT_MATTER_SPLIT:
+    block, _ = frontmatter.split(frontmatter.read(skill_dir / "SKILL.md"))
+    if block is None:
         msg = f"{skill_dir} invalid front matter"
         raise ValueError(msg)
-    data = yaml.safe_load(parts[1])
+    data = frontmatter.parse(block)
     if not isinstance(data, dict):
         msg = f"{skill_dir} invalid front matter"
         raise TypeError(msg)
@@ -39,21 +43,35 @@ def load_meta(skill_dir: Path) -> SkillEntry:
     if not isinstance(name, str) or not isinstance(description, str):
         msg = f"{skill_dir} missing name/description"
         raise TypeError(msg)
-    tier = skill_dir.parents[0].name.lstrip(".")
     return SkillEntry(
         name=name,
         description=description,
-        path=str(skill_dir.as_posix()),
-        tier=tier,
+        path=skill_dir.as_posix(),
+        tier=skill_dir.parent.name.lstrip("."),
     )
 
 
 def build_index(root: Path) -> list[SkillEntry]:
     """Collect all skill entries."""
-    entries = [load_meta(skill_path.parent) for skill_path in root.rglob("SKILL.md")]
+    with ThreadPoolExecutor() as executor:
+        entries = list(executor.map(load_meta, iter_skill_dirs(root)))
     return sorted(entries, key=lambda entry: (entry.tier, entry.name))
 
 
+def dump_index(entries: list[SkillEntry]) -> bytes:
+    """Serialize entries as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        payload = json.dumps(
+            [asdict(entry) for entry in entries],
+            ensure_ascii=False,
+            indent=2,
+        )
+        return f"{payload}\n".encode()
+    return orjson.dumps(entries, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint."""
     parser = argparse.ArgumentParser(description="Build skill index")
@@ -65,17 +83,7 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
-    from skillkit.fs import atomic_write
-
-    entries = build_index(args.root)
-    payload = json.dumps(
-        [asdict(entry) for entry in entries],
-        ensure_ascii=False,
-        indent=2,
-    )
-    atomic_write(args.output, payload + "\n")
+    atomic_write(args.output, dump_index(build_index(args.root)))
     sys.stdout.write(f"Wrote {args.output}\n")
     return 0
 
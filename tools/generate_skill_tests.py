@@ -3,29 +3,24 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
-TIERS = [".curated", ".experimental", ".system"]
-
-
-def iter_skill_dirs(skills_root: Path) -> list[Path]:
-    """Return skill directories that include SKILL.md."""
-    skill_dirs: list[Path] = []
-    for skill_md in skills_root.rglob("SKILL.md"):
-        if "__pycache__" in skill_md.parts:
-            continue
-        skill_dirs.append(skill_md.parent)
-    return skill_dirs
-
+try:
+    from skillkit.fs import iter_skill_dirs
+    from skillkit.naming import test_filename_for_skill
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+    from skillkit.fs import iter_skill_dirs
+    from skillkit.naming import test_filename_for_skill
 
-def test_filename_for_skill(name: str) -> str:
-    """Return the canonical test filename for a skill."""
-    return f"test_{name.replace('-', '_')}.py"
+TIERS = [".curated", ".experimental", ".system"]
 
 
-def render_test(skill_name: str) -> str:
-    """Render the pytest skeleton for a script-backed skill."""
-    lines = [
+_SKILL_NAME_PLACEHOLDER = "__SKILL_NAME__"
+_TEST_TEMPLATE = "\n".join(
+    [
         "from __future__ import annotations",
         "",
         "import json",
@@ -35,7 +30,7 @@ def render_test(skill_name: str) -> str:
         "",
         "",
         "REPO_ROOT = Path(__file__).resolve().parents[2]",
-        f'SKILL_NAME = "{skill_name}"',
+        f'SKILL_NAME = "{_SKILL_NAME_PLACEHOLDER}"',
         f"TIERS = {TIERS!r}",
         "",
         "",
@@ -103,8 +98,47 @@ def render_test(skill_name: str) -> str:
         '    assert obj["ok"] is False',
         '    assert obj["changed"] is False',
         "",
+    ],
+)
+
+
+def render_test(skill_name: str) -> str:
+    """Render the pytest skeleton for a script-backed skill."""
+    return _TEST_TEMPLATE.replace(_SKILL_NAME_PLACEHOLDER, skill_name)
+
+
+def write_skill_test(skill_dir: Path, tests_dir: Path, overwrite: bool) -> bool | None:
+    """Write the skeleton test for a skill.
+
+    Returns True when a file was written, False when an existing test was kept
+    (including an up-to-date one under --overwrite), and None when the skill is
+    not script-backed.
+    """
+    name = skill_dir.name
+    entry = skill_dir / "scripts" / "run.py"
+    if not entry.exists():
+        return None
+
+    test_path = tests_dir / test_filename_for_skill(name)
+    rendered = render_test(name)
+    if test_path.exists() and (
+        not overwrite or test_path.read_bytes() == rendered.encode("utf-8")
+    ):
+        return False
+
+    test_path.write_text(rendered, encoding="utf-8")
+    return True
+
+
+def write_skill_tests(
+    skill_dirs: list[Path],
+    tests_dir: Path,
+    overwrite: bool,
+) -> list[bool | None]:
+    """Write tests for skills that share one test file, in order."""
+    return [
+        write_skill_test(skill_dir, tests_dir, overwrite) for skill_dir in skill_dirs
     ]
-    return "\n".join(lines)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -127,22 +161,24 @@ def main(argv: list[str] | None = None) -> int:
 
     tests_dir.mkdir(parents=True, exist_ok=True)
 
-    created = 0
-    skipped = 0
-
+    # Skills with the same name in different tiers share a test file; keep
+    # each such group in one job so they are handled in order, not raced.
+    groups: dict[str, list[Path]] = {}
     for skill_dir in sorted(iter_skill_dirs(skills_root)):
-        name = skill_dir.name
-        entry = skill_dir / "scripts" / "run.py"
-        if not entry.exists():
-            continue
-
-        test_path = tests_dir / test_filename_for_skill(name)
-        if test_path.exists() and not ns.overwrite:
-            skipped += 1
-            continue
-
-        test_path.write_text(render_test(name), encoding="utf-8")
-        created += 1
+        groups.setdefault(test_filename_for_skill(skill_dir.name), []).append(skill_dir)
+    write_group = partial(
+        write_skill_tests,
+        tests_dir=tests_dir,
+        overwrite=ns.overwrite,
+    )
+    with ThreadPoolExecutor() as executor:
+        results = [
+            result
+            for group_results in executor.map(write_group, groups.values())
+            for result in group_results
+        ]
+    created = results.count(True)
+    skipped = results.count(False)
 
     sys.stdout.write(f"✅ tests generated: {created}, skipped: {skipped}\n")
     return 0
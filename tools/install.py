@@ -3,14 +3,37 @@
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a file, copying it when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 def install_skill(source: Path, destination: Path, mode: str) -> None:
-    """Install a skill by symlink or copy."""
-    destination.parent.mkdir(parents=True, exist_ok=True)
+    """Install a skill by symlink, copy, or hard-linked copy.
+
+    The destination's parent directory must already exist. A symlink that
+    already points at ``source`` is left in place.
+    """
+    if (
+        mode == "symlink"
+        and destination.is_symlink()
+        and destination.readlink() == source
+    ):
+        return
     if destination.exists() or destination.is_symlink():
         if destination.is_dir() and not destination.is_symlink():
             shutil.rmtree(destination)
@@ -18,17 +41,29 @@ def install_skill(source: Path, destination: Path, mode: str) -> None:
             destination.unlink()
     if mode == "symlink":
         destination.symlink_to(source, target_is_directory=True)
+    elif mode == "hardlink":
+        shutil.copytree(source, destination, copy_function=link_or_copy)
     else:
         shutil.copytree(source, destination)
 
 
+def install_skill_into(source: Path, targets: Iterable[Path], mode: str) -> None:
+    """Install one skill into each target directory in turn."""
+    for target in targets:
+        install_skill(source, target / source.name, mode)
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint."""
     parser = argparse.ArgumentParser(description="Install curated skills")
     parser.add_argument(
         "--mode",
-        choices=["symlink", "copy"],
+        choices=["symlink", "copy", "hardlink"],
         default="symlink",
+        help=(
+            "hardlink builds a real directory tree whose files share data with "
+            "the source (falls back to copying across filesystems)"
+        ),
     )
     parser.add_argument(
         "--codex-dir",
@@ -52,9 +87,21 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     skills = [path for path in args.source.iterdir() if path.is_dir()]
-    for skill in skills:
-        install_skill(skill, args.codex_dir / skill.name, args.mode)
-        install_skill(skill, args.claude_dir / skill.name, args.mode)
+    args.codex_dir.mkdir(parents=True, exist_ok=True)
+    args.claude_dir.mkdir(parents=True, exist_ok=True)
+    # The two directories may be the same or alias each other via symlinks;
+    # installing twice into one destination from two threads would race.
+    unique_targets: dict[Path, Path] = {}
+    for target in (args.codex_dir, args.claude_dir):
+        unique_targets.setdefault(target.resolve(), target)
+    targets = tuple(unique_targets.values())
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(install_skill_into, skill, targets, args.mode)
+            for skill in skills
+        ]
+    for future in futures:
+        future.result()
 
     sys.stdout.write(
         f"Installed {len(skills)} skills to {args.codex_dir} and {args.claude_dir}\n",
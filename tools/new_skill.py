@@ -1,58 +1,100 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
+import os
 import re
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    from skillkit.naming import (
+        MAX_DESCRIPTION_LENGTH,
+        skill_name_error,
+        test_filename_for_skill,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+    from skillkit.naming import (
+        MAX_DESCRIPTION_LENGTH,
+        skill_name_error,
+        test_filename_for_skill,
+    )
+
+if TYPE_CHECKING:
+    import argparse
 
-AGENT_SKILLS_NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
-MAX_NAME_LENGTH = 64
-MAX_DESCRIPTION_LENGTH = 500
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_WHITESPACE_RE = re.compile(r"\s+")
+_YAML_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+SHORT_DESCRIPTION_LENGTH = 120
 TIERS = [".curated", ".experimental", ".system"]
+_FRONT_MATTER_TEMPLATE = """\
+---
+name: {name}
+description: {description}
+license: {license}
+compatibility: "Requires Python and uv. Scripts follow docs/script-contract.md."
+metadata:
+  short-description: {short_description}
+{extra}---
+"""
+_SCRIPT_USAGE = (
+    "## Scripts\n"
+    "This skill is script-backed.\n"
+    "\n"
+    "- Scripts live in `./scripts/`.\n"
+    "- Scripts MUST follow `docs/script-contract.md` "
+    "(JSON output option, dry-run by default, etc.).\n"
+    "\n"
+    "### Quick start\n"
+    "From the repository root (recommended):\n"
+    "\n"
+    "```bash\n"
+    "uv run python <PATH_TO_SKILL_DIR>/scripts/run.py --help\n"
+    "```\n"
+    "\n"
+    "Note: Codex injects the skill file path into context, "
+    "so you can locate `<PATH_TO_SKILL_DIR>` reliably.\n"
+)
+_INSTRUCTION_NOTES = (
+    "## Notes\n"
+    "- This is an instruction-only skill. Prefer adding scripts "
+    "only when you need determinism or tool orchestration.\n"
+)
 
 
 def validate_skill_name(name: str) -> None:
     """Validate skill name against the Agent Skills open standard (strict subset)."""
-    if not (1 <= len(name) <= MAX_NAME_LENGTH):
-        msg = "skill name must be 1-64 characters"
-        raise ValueError(msg)
-    if not AGENT_SKILLS_NAME_RE.match(name):
-        msg = (
-            "skill name must match ^[a-z0-9]+(?:-[a-z0-9]+)*$ "
-            "(lowercase/digits/hyphens)"
-        )
-        raise ValueError(msg)
-    if "--" in name:
-        msg = "skill name must not contain consecutive hyphens ('--')"
+    msg = skill_name_error(name)
+    if msg:
         raise ValueError(msg)
 
 
+@lru_cache(maxsize=256)
 def single_line(text: str) -> str:
     """Collapse multi-line text into a single line."""
-    text = " ".join(text.strip().splitlines()).strip()
-    return re.sub(r"\s+", " ", text)
+    return _WHITESPACE_RE.sub(" ", text.strip())
 
 
+@lru_cache(maxsize=256)
 def title_from_name(name: str) -> str:
     """Create a title-cased display string from the skill name."""
     return " ".join(part.capitalize() for part in name.split("-"))
 
 
+@lru_cache(maxsize=256)
 def yaml_escape_single_line(text: str) -> str:
     """Quote YAML scalar content on a single line."""
     cleaned = single_line(text)
-    cleaned = cleaned.replace("\\", "\\\\").replace('"', '\\"')
+    if "\\" in cleaned or '"' in cleaned:
+        cleaned = cleaned.translate(_YAML_ESCAPE_TABLE)
     return f'"{cleaned}"'
 
 
-def test_filename_for_skill(name: str) -> str:
-    """Return the canonical test filename for a skill."""
-    return f"test_{name.replace('-', '_')}.py"
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateSkillRequest:
     """Captured inputs for a new skill scaffold."""
 
@@ -71,98 +113,60 @@ def render_skill_md(req: CreateSkillRequest) -> str:
     """Render the SKILL.md template for a new skill."""
     title = title_from_name(req.name)
 
-    frontmatter_lines = [
-        "---",
-        f"name: {req.name}",
-        f"description: {yaml_escape_single_line(req.description)}",
-        f"license: {yaml_escape_single_line(req.license_name)}",
-        (
-            'compatibility: "Requires Python and uv. Scripts follow '
-            'docs/script-contract.md."'
-        ),
-        "metadata:",
-        f"  short-description: {yaml_escape_single_line(req.description[:120])}",
-    ]
+    extra = ""
     if req.author:
-        frontmatter_lines.append(f"  author: {yaml_escape_single_line(req.author)}")
+        extra += f"  author: {yaml_escape_single_line(req.author)}\n"
     if req.tags:
-        tags = ", ".join(req.tags)
-        frontmatter_lines.append(f"  tags: [{tags}]")
-    frontmatter_lines.append("---")
+        extra += f"  tags: [{', '.join(req.tags)}]\n"
+    description = yaml_escape_single_line(req.description)
+    short_description = (
+        description
+        if len(req.description) <= SHORT_DESCRIPTION_LENGTH
+        else yaml_escape_single_line(req.description[:SHORT_DESCRIPTION_LENGTH])
+    )
+    front_matter = _FRONT_MATTER_TEMPLATE.format_map(
+        {
+            "name": req.name,
+            "description": description,
+            "license": yaml_escape_single_line(req.license_name),
+            "short_description": short_description,
+            "extra": extra,
+        },
+    )
 
-    body_lines: list[str] = [
-        f"# {title}",
-        "",
-        "## Overview",
-        "- TODO: 1-2 sentencesで、このスキルが何をするか(何を助けるか)を書く。",
-        "",
-        "## When to use",
-        (
-            "- TODO: ユーザーの依頼文に現れる具体キーワード/状況"
-            '(例: "build", "CI fails", "go test" など)を書く。'
-        ),
-        "",
-        "## Workflow",
-        "1. TODO: 前提確認(リポジトリ種別、言語、ビルドツールの特定)",
-        "2. TODO: 実行(dry-run → apply の順、ログの提示)",
-        "3. TODO: 検証(テスト/フォーマット/リンター)",
-        "4. TODO: 変更がある場合は差分と理由をまとめる",
-        "",
-    ]
+    usage = _SCRIPT_USAGE if req.run_type == "script" else _INSTRUCTION_NOTES
 
-    if req.run_type == "script":
-        body_lines += [
-            "## Scripts",
-            "This skill is script-backed.",
-            "",
-            "- Scripts live in `./scripts/`.",
-            (
-                "- Scripts MUST follow `docs/script-contract.md` "
-                "(JSON output option, dry-run by default, etc.)."
-            ),
-            "",
-            "### Quick start",
-            "From the repository root (recommended):",
-            "",
-            "```bash",
-            "uv run python <PATH_TO_SKILL_DIR>/scripts/run.py --help",
-            "```",
-            "",
-            (
-                "Note: Codex injects the skill file path into context, "
-                "so you can locate `<PATH_TO_SKILL_DIR>` reliably."
-            ),
-            "",
-        ]
-    else:
-        body_lines += [
-            "## Notes",
-            (
-                "- This is an instruction-only skill. Prefer adding scripts "
-                "only when you need determinism or tool orchestration."
-            ),
-            "",
-        ]
-
-    body_lines += [
-        "## Examples",
-        "- TODO: 入力例(ユーザーが言いそうな依頼)",
-        "- TODO: 出力例(どういう結果/差分/ログになるべきか)",
-        "",
-    ]
+    return f"""{front_matter}
+# {title}
 
-    return "\n".join([*frontmatter_lines, "", *body_lines])
+## Overview
+- TODO: 1-2 sentencesで、このスキルが何をするか(何を助けるか)を書く。
 
+## When to use
+- TODO: ユーザーの依頼文に現れる具体キーワード/状況\
+(例: "build", "CI fails", "go test" など)を書く。
 
-def render_script_stub(req: CreateSkillRequest) -> str:
-    """Render a script stub that follows the script contract."""
-    return f"""#!/usr/bin/env python3
+## Workflow
+1. TODO: 前提確認(リポジトリ種別、言語、ビルドツールの特定)
+2. TODO: 実行(dry-run → apply の順、ログの提示)
+3. TODO: 検証(テスト/フォーマット/リンター)
+4. TODO: 変更がある場合は差分と理由をまとめる
+
+{usage}
+## Examples
+- TODO: 入力例(ユーザーが言いそうな依頼)
+- TODO: 出力例(どういう結果/差分/ログになるべきか)
+"""
+
+
+_SKILL_NAME_PLACEHOLDER = "__SKILL_NAME__"
+_SCRIPT_STUB_TEMPLATE = """#!/usr/bin/env python3
 from __future__ import annotations
 
 import argparse
 import json
 import sys
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -181,8 +185,8 @@ class Result:
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        prog="{req.name}:run",
-        description="Script entrypoint for the '{req.name}' skill.",
+        prog="__SKILL_NAME__:run",
+        description="Script entrypoint for the '__SKILL_NAME__' skill.",
     )
     parser.add_argument(
         "--json",
@@ -212,7 +216,7 @@ def main(argv: list[str]) -> int:
 
     cwd = Path(args.cwd).resolve()
     if not cwd.exists():
-        log(f"❌ precondition failed: --cwd does not exist: {{cwd}}")
+        log(f"❌ precondition failed: --cwd does not exist: {cwd}")
         res = Result(
             ok=False,
             summary="precondition failed: cwd does not exist",
@@ -220,16 +224,16 @@ def main(argv: list[str]) -> int:
             actions=[],
             artifacts=[],
             warnings=[],
-            errors=[{{"message": "cwd does not exist", "code": "cwd_missing"}}],
-            metadata={{"skill": "{req.name}"}},
+            errors=[{"message": "cwd does not exist", "code": "cwd_missing"}],
+            metadata={"skill": "__SKILL_NAME__"},
         )
         if args.json:
-            print(json.dumps(asdict(res), ensure_ascii=False))
+            print(json.dumps(vars(res), ensure_ascii=False))
         return 3
 
     actions: list[dict[str, Any]] = []
     if not args.apply:
-        actions.append({{"kind": "info", "detail": "dry-run: no changes will be made"}})
+        actions.append({"kind": "info", "detail": "dry-run: no changes will be made"})
 
     res = Result(
         ok=True,
@@ -239,11 +243,11 @@ def main(argv: list[str]) -> int:
         artifacts=[],
         warnings=[],
         errors=[],
-        metadata={{"skill": "{req.name}", "cwd": str(cwd)}},
+        metadata={"skill": "__SKILL_NAME__", "cwd": str(cwd)},
     )
 
     if args.json:
-        print(json.dumps(asdict(res), ensure_ascii=False))
+        print(json.dumps(vars(res), ensure_ascii=False))
     else:
         print(res.summary)
 
@@ -255,9 +259,13 @@ if __name__ == "__main__":
 """
 
 
-def render_test_stub(skill_name: str) -> str:
-    """Render a pytest skeleton for script-backed skills."""
-    lines = [
+def render_script_stub(req: CreateSkillRequest) -> str:
+    """Render a script stub that follows the script contract."""
+    return _SCRIPT_STUB_TEMPLATE.replace(_SKILL_NAME_PLACEHOLDER, req.name)
+
+
+_TEST_STUB_TEMPLATE = "\n".join(
+    [
         "from __future__ import annotations",
         "",
         "import json",
@@ -267,7 +275,7 @@ def render_test_stub(skill_name: str) -> str:
         "",
         "",
         "REPO_ROOT = Path(__file__).resolve().parents[2]",
-        f'SKILL_NAME = "{skill_name}"',
+        f'SKILL_NAME = "{_SKILL_NAME_PLACEHOLDER}"',
         f"TIERS = {TIERS!r}",
         "",
         "",
@@ -341,19 +349,25 @@ def render_test_stub(skill_name: str) -> str:
         "#   that fixture.",
         "# - Assert it chooses the right commands and reports diagnostics correctly.",
         "",
-    ]
-    return "\n".join(lines)
+    ],
+)
+
+
+def render_test_stub(skill_name: str) -> str:
+    """Render a pytest skeleton for script-backed skills."""
+    return _TEST_STUB_TEMPLATE.replace(_SKILL_NAME_PLACEHOLDER, skill_name)
 
 
 def write_text(path: Path, content: str, executable: bool = False) -> None:
-    """Write a file to disk and optionally set executable bits."""
-    path.write_text(content, encoding="utf-8")
-    if executable:
-        try:
-            mode = path.stat().st_mode
-            path.chmod(mode | 0o111)
-        except OSError:
-            pass
+    """Create a new UTF-8 file, executable when requested.
+
+    The mode is set at creation time (subject to the umask), so no separate
+    chmod is needed. Existing files are never overwritten.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    fd = os.open(path, flags, 0o777 if executable else 0o666)
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(content.encode("utf-8"))
 
 
 def parse_tags(raw: str | None) -> list[str]:
@@ -422,18 +436,23 @@ def build_request(ns: argparse.Namespace, name: str, desc: str) -> CreateSkillRe
 def ensure_output_dir(req: CreateSkillRequest) -> Path:
     """Compute and validate the skill output directory."""
     skill_dir = req.out_root / req.tier / req.name
-    if skill_dir.exists():
-        msg = f"❌ skill directory already exists: {skill_dir}"
-        raise FileExistsError(msg)
-    return skill_dir
+    try:
+        skill_dir.lstat()
+    except FileNotFoundError:
+        return skill_dir
+    msg = f"❌ skill directory already exists: {skill_dir}"
+    raise FileExistsError(msg)
 
 
 def create_scaffold(skill_dir: Path, req: CreateSkillRequest) -> None:
     """Write scaffold files to disk."""
-    (skill_dir / "references").mkdir(parents=True, exist_ok=False)
-    (skill_dir / "assets").mkdir(parents=True, exist_ok=False)
-    if req.run_type == "script":
-        (skill_dir / "scripts").mkdir(parents=True, exist_ok=False)
+    references_dir = skill_dir / "references"
+    assets_dir = skill_dir / "assets"
+    scripts_dir = skill_dir / "scripts" if req.run_type == "script" else None
+    references_dir.mkdir(parents=True, exist_ok=False)
+    assets_dir.mkdir(parents=True, exist_ok=False)
+    if scripts_dir is not None:
+        scripts_dir.mkdir(parents=True, exist_ok=False)
 
     write_text(skill_dir / "SKILL.md", render_skill_md(req))
     write_text(
@@ -441,27 +460,26 @@ def create_scaffold(skill_dir: Path, req: CreateSkillRequest) -> None:
         "TODO: Add license text or reference your repository license.\n",
     )
     write_text(
-        skill_dir / "references" / "README.md",
+        references_dir / "README.md",
         "# References\n\nTODO: Add reference docs for this skill.\n",
     )
     write_text(
-        skill_dir / "assets" / "README.md",
+        assets_dir / "README.md",
         (
             "# Assets\n\n"
             "TODO: Add templates or assets (not loaded into context by default).\n"
         ),
     )
 
-    if req.run_type == "script":
+    if scripts_dir is not None:
         write_text(
-            skill_dir / "scripts" / "run.py",
+            scripts_dir / "run.py",
             render_script_stub(req),
             executable=True,
         )
 
     if req.make_tests:
-        repo_root = Path(__file__).resolve().parents[1]
-        tests_path = repo_root / "tests" / "skills" / test_filename_for_skill(req.name)
+        tests_path = _REPO_ROOT / "tests" / "skills" / test_filename_for_skill(req.name)
         if not tests_path.exists():
             tests_path.parent.mkdir(parents=True, exist_ok=True)
             write_text(tests_path, render_test_stub(req.name))
@@ -471,6 +489,8 @@ def create_scaffold(skill_dir: Path, req: CreateSkillRequest) -> None:
 
 def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Create a new skill scaffold (repo conventions + script contract).",
     )
@@ -4,44 +4,54 @@ from __future__ import annotations
 
 import argparse
 import importlib
-import importlib.util
 import json
 import os
-import re
 import subprocess
 import sys
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    from skillkit import frontmatter
+    from skillkit.fs import atomic_write, iter_skill_dirs
+    from skillkit.naming import (
+        MAX_DESCRIPTION_LENGTH,
+        skill_name_error,
+        test_filename_for_skill,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+    from skillkit import frontmatter
+    from skillkit.fs import atomic_write, iter_skill_dirs
+    from skillkit.naming import (
+        MAX_DESCRIPTION_LENGTH,
+        skill_name_error,
+        test_filename_for_skill,
+    )
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from types import ModuleType
 
-AGENT_SKILLS_NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 EXIT_PRECONDITION = 3
-MAX_DESCRIPTION_LENGTH = 500
-MAX_NAME_LENGTH = 64
-
-
-def validate_skill_name(name: str) -> str | None:
-    """Validate the skill name against the Agent Skills standard."""
-    if not (1 <= len(name) <= MAX_NAME_LENGTH):
-        return "skill name must be 1-64 characters"
-    if not AGENT_SKILLS_NAME_RE.match(name):
-        return (
-            "skill name must match ^[a-z0-9]+(?:-[a-z0-9]+)* (lowercase/digits/hyphens)"
-        )
-    if "--" in name:
-        return "skill name must not contain consecutive hyphens ('--')"
-    return None
-
-
-def test_filename_for_skill(name: str) -> str:
-    """Return the canonical test filename for a skill."""
-    return f"test_{name.replace('-', '_')}.py"
-
-
-@dataclass(frozen=True)
+_PY = sys.executable
+
+FrontmatterResult = tuple[
+    str | None,
+    str | None,
+    dict[str, Any] | None,
+    str | None,
+]
+FrontmatterCache = dict[str, tuple[int, int, FrontmatterResult]]
+CACHE_ENTRY_FIELDS = 5
+# Bump whenever parsing rules or the entry layout change.
+CACHE_FORMAT_VERSION = 2
+FRONTMATTER_CACHE_PATH = Path(".cache") / "validate_skills" / "frontmatter.json"
+
+
+@dataclass(frozen=True, slots=True)
 class Issue:
     """Issue found during validation."""
 
@@ -50,7 +60,7 @@ class Issue:
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillReport:
     """Validation report for a single skill."""
 
@@ -62,33 +72,36 @@ class SkillReport:
     issues: list[Issue]
 
 
-def extract_frontmatter_text(lines: list[str]) -> tuple[str | None, str | None]:
-    """Extract the YAML frontmatter block from SKILL.md lines."""
-    if not lines or lines[0].strip() != "---":
-        return None, "missing YAML frontmatter start line '---'"
-
-    end_idx = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_idx = i
-            break
-    if end_idx is None:
-        return None, "missing YAML frontmatter end line '---'"
-
-    return "\n".join(lines[1:end_idx]), None
+@cache
+def yaml_module() -> ModuleType | None:
+    """Return the PyYAML module, or None when it is not installed."""
+    try:
+        return importlib.import_module("yaml")
+    except ImportError:
+        return None
 
 
 def parse_yaml_frontmatter(
     yaml_text: str,
 ) -> tuple[str | None, str | None, dict[str, Any] | None, str | None]:
-    """Parse YAML frontmatter using PyYAML."""
-    yaml_module = importlib.import_module("yaml")
+    """Parse YAML frontmatter using PyYAML, or the minimal parser without it."""
+    yaml = yaml_module()
+    if yaml is None:
+        return parse_minimal_frontmatter(yaml_text)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        data = yaml_module.safe_load(yaml_text) or {}
+        data = yaml.load(yaml_text, Loader=loader) or {}
     except Exception:
         return None, None, None, "frontmatter YAML could not be parsed"
     if not isinstance(data, dict):
         return None, None, None, "frontmatter YAML must be a mapping/object"
+    return frontmatter_fields(data)
+
+
+def frontmatter_fields(
+    data: dict[str, Any],
+) -> tuple[str | None, str | None, dict[str, Any] | None, str | None]:
+    """Return name/description from parsed frontmatter data."""
     name = data.get("name")
     desc = data.get("description")
     return (
@@ -106,18 +119,16 @@ def parse_minimal_frontmatter(
     name = None
     desc = None
     for raw in yaml_text.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
+        # Comment and blank lines never yield a matching key, so only the
+        # key is stripped up front; values are cleaned for matches alone.
+        key, sep, value = raw.partition(":")
+        if not sep:
             continue
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
         key = key.strip()
-        val = value.strip().strip('"').strip("'")
         if key == "name":
-            name = val
+            name = value.strip().strip('"').strip("'")
         elif key == "description":
-            desc = val
+            desc = value.strip().strip('"').strip("'")
     if name is None or desc is None:
         return name, desc, None, "failed to parse frontmatter (install PyYAML)"
     return name, desc, None, None
@@ -125,31 +136,102 @@ def parse_minimal_frontmatter(
 
 def parse_frontmatter_block(
     skill_md: Path,
-) -> tuple[str | None, str | None, dict[str, Any] | None, str | None]:
-    """Parse YAML frontmatter and return name/description with errors."""
-    text = skill_md.read_text(encoding="utf-8")
-    yaml_text, error = extract_frontmatter_text(text.splitlines())
+    cache: FrontmatterCache | None = None,
+) -> FrontmatterResult:
+    """Parse YAML frontmatter and return name/description with errors.
+
+    With a ``cache`` (``--cache``), results are reused while the file's mtime
+    and size are unchanged, and new results are recorded in it.
+    """
+    if cache is None:
+        return parse_frontmatter_text(frontmatter.read(skill_md))
+    stat = skill_md.stat()
+    key = os.fspath(skill_md)
+    cached = cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    result = parse_frontmatter_text(frontmatter.read(skill_md))
+    cache[key] = (stat.st_mtime_ns, stat.st_size, result)
+    return result
+
+
+def frontmatter_cache_stamp() -> list[object]:
+    """Return the stamp that ties cache files to this parser setup."""
+    return [CACHE_FORMAT_VERSION, yaml_module() is not None]
+
+
+def is_frontmatter_cache_entry(entry: object) -> bool:
+    """Check a cache entry is ``[mtime_ns, size, name, desc, error]``."""
+    if not isinstance(entry, list) or len(entry) != CACHE_ENTRY_FIELDS:
+        return False
+    mtime_ns, size, *texts = entry
+    return all(type(value) is int for value in (mtime_ns, size)) and all(
+        value is None or isinstance(value, str) for value in texts
+    )
+
+
+def load_frontmatter_cache(cache_file: Path) -> FrontmatterCache:
+    """Load frontmatter parses from a JSON cache file.
+
+    Files written by another cache format, or with PyYAML present where it
+    is now missing (or the reverse), are ignored.
+    """
+    cache: FrontmatterCache = {}
+    try:
+        payload = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return cache
+    if (
+        not isinstance(payload, dict)
+        or payload.get("stamp") != frontmatter_cache_stamp()
+        or not isinstance(entries := payload.get("entries"), dict)
+    ):
+        return cache
+    for key, entry in entries.items():
+        if is_frontmatter_cache_entry(entry):
+            mtime_ns, size, name, desc, error = entry
+            cache[key] = (mtime_ns, size, (name, desc, None, error))
+    return cache
+
+
+def save_frontmatter_cache(
+    cache_file: Path,
+    cache: FrontmatterCache,
+    skill_mds: list[Path],
+) -> None:
+    """Persist cached results for the given SKILL.md files as JSON."""
+    entries = {}
+    for skill_md in skill_mds:
+        key = os.fspath(skill_md)
+        cached = cache.get(key)
+        if cached is not None:
+            mtime_ns, size, (name, desc, _raw, error) = cached
+            entries[key] = [mtime_ns, size, name, desc, error]
+    payload = {"stamp": frontmatter_cache_stamp(), "entries": entries}
+    atomic_write(cache_file, json.dumps(payload, ensure_ascii=False))
+
+
+def parse_frontmatter_text(text: str) -> FrontmatterResult:
+    """Parse SKILL.md text and return name/description with errors."""
+    yaml_text, error = frontmatter.split(text)
     if error:
         return None, None, None, error
     if yaml_text is None:
         return None, None, None, "missing YAML frontmatter"
-    if importlib.util.find_spec("yaml") is not None:
-        return parse_yaml_frontmatter(yaml_text)
-    return parse_minimal_frontmatter(yaml_text)
+    data = frontmatter.parse_simple(yaml_text)
+    if data is not None:
+        return frontmatter_fields(data)
+    return parse_yaml_frontmatter(yaml_text)
 
 
-def iter_skill_dirs(skills_root: Path) -> Iterable[Path]:
-    """Return skill directories that include SKILL.md."""
-    for skill_md in skills_root.rglob("SKILL.md"):
-        if "__pycache__" in skill_md.parts:
-            continue
-        yield skill_md.parent
+def detect_tier(skills_prefix: str, skill_dir: Path) -> str:
+    """Detect the tier from the directory path.
 
-
-def detect_tier(skills_root: Path, skill_dir: Path) -> str:
-    """Detect the tier from the directory path."""
-    rel = skill_dir.relative_to(skills_root)
-    return rel.parts[0] if rel.parts else "unknown"
+    ``skills_prefix`` is the skills root with a trailing separator, so the
+    tier is the first component of what follows it.
+    """
+    rel = str(skill_dir)[len(skills_prefix) :]
+    return rel.split(os.sep, 1)[0] or "unknown"
 
 
 def find_entry_script(skill_dir: Path) -> Path | None:
@@ -158,28 +240,43 @@ def find_entry_script(skill_dir: Path) -> Path | None:
     return script if script.exists() else None
 
 
-def run_entry_script(
-    script: Path,
+def start_entry_script(
+    command: list[str],
     args: list[str],
-    repo_root: Path,
-) -> subprocess.CompletedProcess[str]:
-    """Run a skill entry script from the repository root."""
-    return subprocess.run(  # noqa: S603
-        [sys.executable, str(script), *args],
-        cwd=str(repo_root),
-        text=True,
-        capture_output=True,
-        env={**os.environ},
-        check=False,
+    cwd: str,
+) -> subprocess.Popen[bytes]:
+    """Start a skill entry script from the repository root."""
+    return subprocess.Popen(  # noqa: S603
+        [*command, *args],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
 
 
+def wait_entry_script(
+    proc: subprocess.Popen[bytes],
+) -> subprocess.CompletedProcess[bytes]:
+    """Collect the output of a started entry script, killing it on error."""
+    try:
+        stdout, stderr = proc.communicate()
+    except BaseException:
+        proc.kill()
+        raise
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+def stderr_excerpt(proc: subprocess.CompletedProcess[bytes]) -> str:
+    """Return the start of a probe's stderr for issue messages."""
+    return proc.stderr.decode("utf-8", "replace").strip()[:400]
+
+
 def validate_json_stdout(
-    proc: subprocess.CompletedProcess[str],
+    proc: subprocess.CompletedProcess[bytes],
 ) -> tuple[dict[str, Any] | None, str | None]:
     """Validate stdout from --json runs."""
     out = proc.stdout
-    if out.strip() == "":
+    if not out or out.isspace():
         return None, "empty stdout in --json mode (must output one JSON object)"
     try:
         obj = json.loads(out)
@@ -204,10 +301,10 @@ def validate_metadata(
     issues: list[Issue],
     skill_md: Path,
     skill_dir: Path,
-    seen_names: dict[str, Path],
+    cache: FrontmatterCache | None = None,
 ) -> tuple[str | None, str | None]:
     """Validate YAML frontmatter metadata."""
-    name, desc, _raw, fm_err = parse_frontmatter_block(skill_md)
+    name, desc, _raw, fm_err = parse_frontmatter_block(skill_md, cache)
     if fm_err:
         add_issue(issues, "error", skill_md, fm_err)
 
@@ -222,18 +319,9 @@ def validate_metadata(
                 skill_md,
                 f"frontmatter name '{name}' must match directory '{dir_name}'",
             )
-        msg = validate_skill_name(name)
+        msg = skill_name_error(name)
         if msg:
             add_issue(issues, "error", skill_md, msg)
-        if name in seen_names:
-            add_issue(
-                issues,
-                "error",
-                skill_md,
-                f"duplicate skill name '{name}' also at {seen_names[name]}",
-            )
-        else:
-            seen_names[name] = skill_dir
 
     if desc is None:
         add_issue(issues, "error", skill_md, "frontmatter must include 'description'")
@@ -257,19 +345,29 @@ def validate_metadata(
     return name, desc
 
 
+def _is_empty_dir(path: Path) -> bool | None:
+    """Return whether a directory is empty, or None when it does not exist."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except FileNotFoundError:
+        return None
+
+
 def validate_directories(issues: list[Issue], skill_dir: Path) -> None:
     """Validate recommended directories."""
     refs_dir = skill_dir / "references"
     assets_dir = skill_dir / "assets"
 
-    if not refs_dir.exists():
+    refs_empty = _is_empty_dir(refs_dir)
+    if refs_empty is None:
         add_issue(
             issues,
             "warning",
             skill_dir,
             "missing references/ directory (recommended)",
         )
-    elif not any(refs_dir.iterdir()):
+    elif refs_empty:
         add_issue(
             issues,
             "warning",
@@ -277,7 +375,7 @@ def validate_directories(issues: list[Issue], skill_dir: Path) -> None:
             "references/ is empty (add README.md at least)",
         )
 
-    if assets_dir.exists() and not any(assets_dir.iterdir()):
+    if _is_empty_dir(assets_dir):
         add_issue(
             issues,
             "warning",
@@ -292,12 +390,15 @@ def validate_tests(
     tier: str,
     skill_dir: Path,
     entry: Path | None,
+    *,
+    existing_tests: frozenset[str],
 ) -> None:
     """Validate pytest presence for script-backed skills."""
     if entry is None:
         return
-    test_file = repo_root / "tests" / "skills" / test_filename_for_skill(skill_dir.name)
-    if not test_file.exists():
+    test_name = test_filename_for_skill(skill_dir.name)
+    if test_name not in existing_tests:
+        test_file = repo_root / "tests" / "skills" / test_name
         level = "error" if tier == ".curated" else "warning"
         add_issue(
             issues,
@@ -307,13 +408,34 @@ def validate_tests(
         )
 
 
+def list_test_files(tests_dir: Path) -> frozenset[str]:
+    """Return the file names in the skill test directory, if it exists."""
+    try:
+        with os.scandir(tests_dir) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
 def validate_exec_mode(
     issues: list[Issue],
     entry: Path,
     repo_root: Path,
 ) -> None:
-    """Run script-backed entrypoints for contract checks."""
-    proc_help = run_entry_script(entry, ["--help"], repo_root=repo_root)
+    """Run script-backed entrypoints for contract checks.
+
+    The ``--help`` and ``--json`` probes are independent, so both are started
+    before either is awaited. Each runs in a ``with`` block, so a started
+    probe is reaped and its pipes closed even if the other one fails.
+    """
+    command = [_PY, str(entry)]
+    root = str(repo_root)
+    with (
+        start_entry_script(command, ["--help"], cwd=root) as help_run,
+        start_entry_script(command, ["--json", "--cwd", root], cwd=root) as json_run,
+    ):
+        proc_help = wait_entry_script(help_run)
+        proc_json = wait_entry_script(json_run)
     if proc_help.returncode != 0:
         add_issue(
             issues,
@@ -322,22 +444,17 @@ def validate_exec_mode(
             (
                 "--help failed "
                 f"(exit={proc_help.returncode}). stderr="
-                f"{proc_help.stderr.strip()[:400]}"
+                f"{stderr_excerpt(proc_help)}"
             ),
         )
 
-    proc_json = run_entry_script(
-        entry,
-        ["--json", "--cwd", str(repo_root)],
-        repo_root=repo_root,
-    )
     obj, err = validate_json_stdout(proc_json)
     if err:
         add_issue(
             issues,
             "error",
             entry,
-            f"--json validation failed: {err}. stderr={proc_json.stderr.strip()[:400]}",
+            f"--json validation failed: {err}. stderr={stderr_excerpt(proc_json)}",
         )
         return
 
@@ -386,16 +503,18 @@ def build_report_path(skill_dir: Path, repo_root: Path) -> Path:
 def validate_skill_dir(
     skill_dir: Path,
     repo_root: Path,
-    skills_root: Path,
+    skills_prefix: str,
     mode: str,
-    seen_names: dict[str, Path],
+    existing_tests: frozenset[str],
+    *,
+    frontmatter_cache: FrontmatterCache | None = None,
 ) -> SkillReport:
     """Validate a single skill directory."""
     skill_md = skill_dir / "SKILL.md"
-    tier = detect_tier(skills_root, skill_dir)
+    tier = detect_tier(skills_prefix, skill_dir)
     issues: list[Issue] = []
 
-    name, desc = validate_metadata(issues, skill_md, skill_dir, seen_names)
+    name, desc = validate_metadata(issues, skill_md, skill_dir, frontmatter_cache)
     validate_directories(issues, skill_dir)
 
     scripts_dir = skill_dir / "scripts"
@@ -408,7 +527,14 @@ def validate_skill_dir(
             "scripts/ exists but scripts/run.py is missing",
         )
 
-    validate_tests(issues, repo_root, tier, skill_dir, entry)
+    validate_tests(
+        issues,
+        repo_root,
+        tier,
+        skill_dir,
+        entry,
+        existing_tests=existing_tests,
+    )
 
     if mode == "exec" and entry is not None:
         validate_exec_mode(issues, entry, repo_root)
@@ -423,6 +549,27 @@ def validate_skill_dir(
     )
 
 
+def add_duplicate_name_issues(
+    skill_dirs: list[Path],
+    reports: list[SkillReport],
+) -> None:
+    """Report skills whose name was already claimed by an earlier skill."""
+    seen_names: dict[str, Path] = {}
+    for skill_dir, report in zip(skill_dirs, reports, strict=True):
+        name = report.name
+        if name is None:
+            continue
+        if name in seen_names:
+            add_issue(
+                report.issues,
+                "error",
+                skill_dir / "SKILL.md",
+                f"duplicate skill name '{name}' also at {seen_names[name]}",
+            )
+        else:
+            seen_names[name] = skill_dir
+
+
 def count_issues(reports: list[SkillReport]) -> tuple[int, int]:
     """Count errors and warnings in reports."""
     total_errors = 0
@@ -436,6 +583,38 @@ def count_issues(reports: list[SkillReport]) -> tuple[int, int]:
     return total_errors, total_warnings
 
 
+def _report_to_dict(report: SkillReport) -> dict[str, Any]:
+    """Convert a report to plain JSON data without a deep copy."""
+    return {
+        "skill_dir": report.skill_dir,
+        "tier": report.tier,
+        "name": report.name,
+        "description": report.description,
+        "script_backed": report.script_backed,
+        "issues": [
+            {"level": item.level, "path": item.path, "message": item.message}
+            for item in report.issues
+        ],
+    }
+
+
+def dump_report(reports: list[SkillReport], summary: dict[str, Any]) -> bytes:
+    """Serialize the JSON report, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        payload = json.dumps(
+            {"summary": summary, "reports": [_report_to_dict(r) for r in reports]},
+            ensure_ascii=False,
+            indent=2,
+        )
+        return f"{payload}\n".encode()
+    return orjson.dumps(
+        {"summary": summary, "reports": reports},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+    )
+
+
 def emit_report(
     reports: list[SkillReport],
     summary: dict[str, Any],
@@ -443,8 +622,9 @@ def emit_report(
 ) -> None:
     """Emit output for CLI."""
     if json_out:
-        payload = {"summary": summary, "reports": [asdict(r) for r in reports]}
-        sys.stdout.write(f"{json.dumps(payload, ensure_ascii=False, indent=2)}\n")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dump_report(reports, summary))
+        sys.stdout.buffer.flush()
         return
 
     sys.stderr.write(f"Skills checked: {summary['skills_checked']}\n")
@@ -486,6 +666,12 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Treat warnings as errors.",
     )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=f"Reuse frontmatter parses stored in {FRONTMATTER_CACHE_PATH}.",
+    )
     ns = parser.parse_args(argv)
 
     repo_root = Path(__file__).resolve().parents[1]
@@ -495,18 +681,26 @@ def main(argv: list[str] | None = None) -> int:
         sys.stderr.write(f"❌ skills root not found: {skills_root}\n")
         return 2
 
-    seen_names: dict[str, Path] = {}
-
-    reports = [
-        validate_skill_dir(
-            skill_dir,
-            repo_root=repo_root,
-            skills_root=skills_root,
-            mode=ns.mode,
-            seen_names=seen_names,
+    skill_dirs = sorted(iter_skill_dirs(skills_root))
+    cache_file = repo_root / FRONTMATTER_CACHE_PATH
+    frontmatter_cache = load_frontmatter_cache(cache_file) if ns.cache else None
+    validate_one = partial(
+        validate_skill_dir,
+        repo_root=repo_root,
+        skills_prefix=str(skills_root).rstrip(os.sep) + os.sep,
+        mode=ns.mode,
+        existing_tests=list_test_files(repo_root / "tests" / "skills"),
+        frontmatter_cache=frontmatter_cache,
+    )
+    with ThreadPoolExecutor() as executor:
+        reports = list(executor.map(validate_one, skill_dirs))
+    add_duplicate_name_issues(skill_dirs, reports)
+    if frontmatter_cache is not None:
+        save_frontmatter_cache(
+            cache_file,
+            frontmatter_cache,
+            [d / "SKILL.md" for d in skill_dirs],
         )
-        for skill_dir in sorted(iter_skill_dirs(skills_root))
-    ]
 
     total_errors, total_warnings = count_issues(reports)
     summary = {